@@ -1,8 +1,15 @@
-import os, re, time, hashlib, html
+import os, re, time, hashlib, html, json, pickle, sqlite3, threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from dateutil import tz
 from typing import List, Dict, Optional, Tuple
 import feedparser, requests, yaml
+from requests.adapters import HTTPAdapter
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml, much faster
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 # -----------------------------
@@ -12,27 +19,67 @@ TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+OPENAI_MODEL = "gpt-4.1-mini"
+CACHE_DB = os.getenv("CACHE_DB", "cache.db")
+SUMMARY_TTL = 14 * 24 * 3600  # seconds
+NEAR_DUP_THRESHOLD = 0.9  # Jaccard similarity of title + summary words
+NEAR_DUP_MIN_WORDS = 8
+# Only these may differ between two near-duplicate stories; any other differing
+# word (a number, name, place...) means it is a different story
+FILLER_WORDS = frozenset("""a an the and or but of to in on at for from by with as is are was were be been
+its it this that these those new now today just also has have had will can""".split())
+
 IST = tz.gettz("Europe/Istanbul")
 
+# Items from general feeds matching these are moved to the gaming section
+MOBILE_KEYWORDS = ["mobile","android","ios","app store","google play","unity","roblox","snapdragon"]
+MOBILE_RE = re.compile(r"\b(" + "|".join(re.escape(k) for k in MOBILE_KEYWORDS) + r")\b", re.I)
+WS_RE = re.compile(r"\s+")
+WORD_RE = re.compile(r"\w+")
+
+# Keep-alive sessions shared across threads so connections are reused.
+# OpenAI gets its own session so the API key is never sent to other hosts.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+
+OPENAI_SESSION = requests.Session()
+OPENAI_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0))
+if OPENAI_API_KEY:
+    OPENAI_SESSION.headers.update({"Authorization": f"Bearer {OPENAI_API_KEY}"})
+
 # -----------------------------
 # Helpers
 # -----------------------------
 def load_sources(path: str = "sources.yaml") -> Dict[str, List[str]]:
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
+@lru_cache(maxsize=4096)
 def canonical_url(u: str) -> str:
     if not u: return u
-    return u.split("?", 1)[0]
+    return u.partition("?")[0]
 
 def normalize_text(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return WS_RE.sub(" ", (s or "")).strip()
 
-def hash_item(title: str, link: str) -> str:
-    return hashlib.sha256((title + canonical_url(link)).encode("utf-8")).hexdigest()[:16]
+def is_mobile_relevant(text: str) -> bool:
+    return MOBILE_RE.search(text) is not None
 
-def score_item(entry: dict) -> float:
-    now = datetime.now(tz=IST)
+@lru_cache(maxsize=4096)
+def hash_item(title: str, link: str) -> str:
+    # Dedup key only, no need for a cryptographic-strength digest
+    return hashlib.blake2b((title + canonical_url(link)).encode("utf-8"), digest_size=8).hexdigest()
+
+def item_key(e: dict) -> str:
+    # Dedup hash, computed once per entry and kept on it
+    h = e.get("_h")
+    if h is None:
+        h = e["_h"] = hash_item(normalize_text(e.get("title","")), canonical_url(e.get("link","")))
+    return h
+
+def score_item(entry: dict, now: Optional[datetime] = None) -> float:
+    if now is None:
+        now = datetime.now(tz=IST)
     recency_hours = 9999
     published = entry.get("published_parsed")
     if published:
@@ -46,71 +93,255 @@ def score_item(entry: dict) -> float:
     summary_len = len(entry.get("summary", ""))
     return (10.0 / recency_hours) + (1.0 if title_ok else 0.0) + min(1.5, summary_len / 400.0)
 
-def fetch_feeds(feed_urls: List[str]) -> List[dict]:
-    items = []
-    for url in feed_urls:
-        try:
-            fp = feedparser.parse(url)
-            items.extend(fp.entries[:30])
-        except Exception:
+def _safe_parse(url: str) -> List[dict]:
+    try:
+        # Conditional GET: unchanged feeds answer 304 and we reuse last run's entries
+        etag, modified, cached = cache_get_feed(url) or (None, None, [])
+        fp = feedparser.parse(url, etag=etag, modified=modified)
+        if fp.get("status") == 304:
+            return cached
+        entries = fp.entries[:30]
+        if entries and (fp.get("etag") or fp.get("modified")):
+            cache_put_feed(url, fp.get("etag"), fp.get("modified"), entries)
+        return entries
+    except Exception:
+        return []
+
+def fetch_feed_groups(*groups: List[str]) -> List[List[dict]]:
+    # Download every feed of every group in one pool, then split back by group
+    urls = [u for g in groups for u in g]
+    if not urls:
+        return [[] for _ in groups]
+    with ThreadPoolExecutor(max_workers=min(16, len(urls))) as ex:
+        results = list(ex.map(_safe_parse, urls))
+    out, i = [], 0
+    for g in groups:
+        out.append([e for r in results[i:i + len(g)] for e in r])
+        i += len(g)
+    return out
+
+# -----------------------------
+# Persistent cache (SQLite, shared across threads)
+# -----------------------------
+_DB: Optional[sqlite3.Connection] = None
+_DB_LOCK = threading.Lock()
+
+def _cache_db() -> sqlite3.Connection:
+    # Caller must hold _DB_LOCK
+    global _DB
+    if _DB is None:
+        _DB = sqlite3.connect(CACHE_DB, check_same_thread=False)
+        _DB.execute("CREATE TABLE IF NOT EXISTS sum_cache(key TEXT PRIMARY KEY, summary TEXT, ts INTEGER)")
+        _DB.execute("CREATE TABLE IF NOT EXISTS near_cache(key TEXT PRIMARY KEY, words TEXT, summary TEXT, ts INTEGER)")
+        _DB.execute("CREATE TABLE IF NOT EXISTS short_cache(url TEXT PRIMARY KEY, short TEXT)")
+        _DB.execute("CREATE TABLE IF NOT EXISTS feed_cache(url TEXT PRIMARY KEY, etag TEXT, modified TEXT, entries BLOB)")
+        cutoff = int(time.time()) - SUMMARY_TTL
+        _DB.execute("DELETE FROM sum_cache WHERE ts <= ?", (cutoff,))
+        _DB.execute("DELETE FROM near_cache WHERE ts <= ?", (cutoff,))
+        _DB.commit()
+    return _DB
+
+def summary_cache_key(title: str, text: str) -> str:
+    return hashlib.sha256(f"{OPENAI_MODEL}|{title}|{text}".encode("utf-8")).hexdigest()
+
+def cache_get_summary(key: str) -> Optional[str]:
+    try:
+        with _DB_LOCK:
+            row = _cache_db().execute(
+                "SELECT summary FROM sum_cache WHERE key=? AND ts>?",
+                (key, int(time.time()) - SUMMARY_TTL),
+            ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error:
+        return None
+
+def cache_put_summary(key: str, summary: str):
+    try:
+        with _DB_LOCK:
+            db = _cache_db()
+            db.execute("INSERT OR REPLACE INTO sum_cache(key, summary, ts) VALUES (?,?,?)", (key, summary, int(time.time())))
+            db.commit()
+    except sqlite3.Error:
+        pass
+
+def story_words(title: str, text: str) -> frozenset:
+    return frozenset(WORD_RE.findall(f"{title} {text}".lower()))
+
+def cache_find_similar(words: frozenset) -> Optional[str]:
+    # Same story reworded by another feed: reuse its summary
+    if len(words) < NEAR_DUP_MIN_WORDS:
+        return None
+    try:
+        with _DB_LOCK:
+            rows = _cache_db().execute(
+                "SELECT words, summary FROM near_cache WHERE ts>?",
+                (int(time.time()) - SUMMARY_TTL,),
+            ).fetchall()
+    except sqlite3.Error:
+        return None
+    best, best_sim = None, NEAR_DUP_THRESHOLD
+    for stored, summary in rows:
+        other = frozenset(stored.split())
+        if not (words ^ other) <= FILLER_WORDS:
             continue
-    return items
+        sim = len(words & other) / len(words | other)
+        if sim >= best_sim:
+            best, best_sim = summary, sim
+    return best
+
+def cache_put_similar(key: str, words: frozenset, summary: str):
+    if len(words) < NEAR_DUP_MIN_WORDS:
+        return
+    try:
+        with _DB_LOCK:
+            db = _cache_db()
+            db.execute("INSERT OR REPLACE INTO near_cache(key, words, summary, ts) VALUES (?,?,?,?)",
+                       (key, " ".join(sorted(words)), summary, int(time.time())))
+            db.commit()
+    except sqlite3.Error:
+        pass
+
+def cache_get_short(url: str) -> Optional[str]:
+    try:
+        with _DB_LOCK:
+            row = _cache_db().execute("SELECT short FROM short_cache WHERE url=?", (url,)).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error:
+        return None
+
+def cache_put_short(url: str, short: str):
+    try:
+        with _DB_LOCK:
+            db = _cache_db()
+            db.execute("INSERT OR REPLACE INTO short_cache(url, short) VALUES (?,?)", (url, short))
+            db.commit()
+    except sqlite3.Error:
+        pass
+
+def cache_get_feed(url: str) -> Optional[Tuple[Optional[str], Optional[str], List[dict]]]:
+    try:
+        with _DB_LOCK:
+            row = _cache_db().execute("SELECT etag, modified, entries FROM feed_cache WHERE url=?", (url,)).fetchone()
+        if not row:
+            return None
+        return row[0], row[1], pickle.loads(row[2])
+    except Exception:
+        return None
+
+def cache_put_feed(url: str, etag: Optional[str], modified: Optional[str], entries: List[dict]):
+    try:
+        blob = pickle.dumps(entries)
+        with _DB_LOCK:
+            db = _cache_db()
+            db.execute("INSERT OR REPLACE INTO feed_cache(url, etag, modified, entries) VALUES (?,?,?,?)",
+                       (url, etag, modified, blob))
+            db.commit()
+    except Exception:
+        pass
 
 # -----------------------------
 # URL Shortener
 # -----------------------------
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=6))
-def shorten_url(url: str) -> str:
-    u = canonical_url(url)
+def _shorten_isgd(u: str) -> Optional[str]:
     try:
-        r = requests.get("https://is.gd/create.php", params={"format":"simple","url":u}, timeout=8)
+        r = SESSION.get("https://is.gd/create.php", params={"format":"simple","url":u}, timeout=8)
         if r.ok and r.text.startswith("http"):
             return r.text.strip()
     except Exception:
         pass
+    return None
+
+def _shorten_tinyurl(u: str) -> Optional[str]:
     try:
-        r = requests.get("https://tinyurl.com/api-create.php", params={"url":u}, timeout=8)
+        r = SESSION.get("https://tinyurl.com/api-create.php", params={"url":u}, timeout=8)
         if r.ok and r.text.startswith("http"):
             return r.text.strip()
     except Exception:
         pass
+    return None
+
+SHORTENERS = [_shorten_isgd, _shorten_tinyurl]
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=6))
+def shorten_url(url: str) -> str:
+    u = canonical_url(url)
+    cached = cache_get_short(u)
+    if cached:
+        return cached
+    # Query all shorteners at once and take the first usable answer
+    ex = ThreadPoolExecutor(max_workers=len(SHORTENERS))
+    try:
+        for fut in as_completed([ex.submit(f, u) for f in SHORTENERS]):
+            short = fut.result()
+            if short:
+                cache_put_short(u, short)
+                return short
+    finally:
+        ex.shutdown(wait=False)
     return u
 
+def shorten_url_many(urls: List[str]) -> Dict[str, str]:
+    unique = list(dict.fromkeys(urls))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(unique))) as ex:
+        return dict(zip(unique, ex.map(shorten_url, unique)))
+
 # -----------------------------
 # Summarizer (max 12 words)
 # -----------------------------
+def cached_summary(title: str, text: str) -> Optional[str]:
+    key = summary_cache_key(title, text)
+    cached = cache_get_summary(key)
+    if cached:
+        return cached
+    # Not written back under this key: a near match stays a guess
+    return cache_find_similar(story_words(title, text))
+
+def store_summary(title: str, text: str, summary: str):
+    key = summary_cache_key(title, text)
+    cache_put_summary(key, summary)
+    cache_put_similar(key, story_words(title, text), summary)
+
 def summarize_with_openai(title: str, text: str) -> Optional[str]:
     if not OPENAI_API_KEY:
         return None
+    cached = cached_summary(title, text)
+    if cached:
+        return cached
+    s = _request_summary(title, text)
+    if s:
+        store_summary(title, text, s)
+    return s
+
+def _post_openai(prompt: str, **extra) -> Optional[str]:
+    body = {"model": OPENAI_MODEL, "input": [{"role":"user","content":prompt}], **extra}
+    r = OPENAI_SESSION.post("https://api.openai.com/v1/responses", json=body, timeout=30)
+    r.raise_for_status()
+    return _output_text(r.json())
+
+def _output_text(out: dict) -> Optional[str]:
+    # Responses API shape first: output[].content[] of type output_text
+    output = out.get("output")
+    if isinstance(output, list):
+        parts = [c["text"] for seg in output if isinstance(seg, dict)
+                 for c in seg.get("content") or [] if c.get("type") == "output_text" and c.get("text")]
+        if parts:
+            return " ".join(parts)
+    if isinstance(output, dict) and output.get("text"):
+        return output["text"]
+    for ch in out.get("choices") or []:
+        txt = ch.get("message", {}).get("content")
+        if txt:
+            return txt
+    return None
+
+def _request_summary(title: str, text: str) -> Optional[str]:
     try:
-        import json
-        headers = {"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"}
         prompt = f"""Write a single headline-style sentence (max 12 words). No emojis. Be specific and concrete. Summarize what's new and why it matters.
 TITLE: {title}
 CONTENT: {text}"""
-        body = {"model": "gpt-4.1-mini", "input": [{"role":"user","content":prompt}]}
-        r = requests.post("https://api.openai.com/v1/responses", headers=headers, json=body, timeout=30)
-        r.raise_for_status()
-        out = r.json()
-        # Extract text robustly
-        cand = None
-        if isinstance(out.get("output"), dict):
-            cand = out["output"].get("text")
-        if not cand and isinstance(out.get("output"), list):
-            parts = []
-            for seg in out["output"]:
-                if isinstance(seg, dict) and "content" in seg:
-                    for c in seg["content"]:
-                        if c.get("type") == "output_text" and c.get("text"):
-                            parts.append(c["text"])
-            if parts:
-                cand = " ".join(parts)
-        if not cand and "choices" in out:
-            for ch in out["choices"]:
-                txt = ch.get("message", {}).get("content")
-                if txt:
-                    cand = txt
-                    break
+        cand = _post_openai(prompt)
         if not cand:
             return None
         words = normalize_text(cand).split()
@@ -118,160 +349,250 @@ CONTENT: {text}"""
     except Exception:
         return None
 
+def summarize_batch(items: List[Tuple[str, str]]) -> Optional[List[str]]:
+    # One request for all items; None if the reply can't be mapped back 1:1
+    if not OPENAI_API_KEY or not items:
+        return None
+    try:
+        listing = "\n".join(f"[{i}] TITLE: {t}\nCONTENT: {x}" for i, (t, x) in enumerate(items, 1))
+        prompt = f"""For each item below, write a single headline-style sentence (max 12 words). No emojis. Be specific and concrete. Summarize what's new and why it matters.
+Return JSON of the form {{"summaries": ["...", "..."]}} with exactly {len(items)} strings, in item order.
+{listing}"""
+        cand = _post_openai(prompt, text={"format": {"type": "json_object"}})
+        if not cand:
+            return None
+        data = json.loads(cand)
+        sums = data.get("summaries") if isinstance(data, dict) else data
+        if not isinstance(sums, list) or len(sums) != len(items):
+            return None
+        out = []
+        for s in sums:
+            words = normalize_text(s if isinstance(s, str) else "").split()
+            if not words:
+                return None
+            out.append(" ".join(words[:12]))
+        return out
+    except Exception:
+        return None
+
+def already_short(title: str, text: str) -> Optional[str]:
+    # A feed summary that already fits the one-liner limit is used as-is, unless
+    # it looks like a teaser ("Continue reading...") or could break the message
+    normalized = normalize_text(text)
+    words = normalized.split()
+    if not 6 <= len(words) <= 12:
+        return None
+    if not normalized.endswith((".", "!", "?")) or normalized.endswith(("...", "…")):
+        return None
+    # Markup, or Markdown entity characters Telegram would fail to parse
+    if any(c in normalized for c in "<>_*`["):
+        return None
+    # Must be about the story: share at least one content word with the title
+    content = {w for w in WORD_RE.findall(title.lower()) if len(w) > 2} - FILLER_WORDS
+    if not content & set(WORD_RE.findall(normalized.lower())):
+        return None
+    return normalized
+
 def summarize(title: str, text: str) -> str:
+    short = already_short(title, text)
+    if short:
+        return short
     s = summarize_with_openai(title, text)
     if s:
         return s
     words = normalize_text(text).split()
     return " ".join(words[:12])
 
+def summarize_many(pairs: List[Tuple[str, str]]) -> List[str]:
+    if not pairs:
+        return []
+    # The same entry can land in both sections: summarize it once
+    keys = [summary_cache_key(*p) for p in pairs]
+    unique = dict(zip(keys, pairs))
+    by_key = dict(zip(unique, _summarize_unique(list(unique.values()))))
+    return [by_key[k] for k in keys]
+
+def _summarize_unique(pairs: List[Tuple[str, str]]) -> List[str]:
+    results: List[Optional[str]] = [already_short(title, text) for title, text in pairs]
+    if OPENAI_API_KEY:
+        for i, (title, text) in enumerate(pairs):
+            if results[i] is None:
+                results[i] = cached_summary(title, text)
+        misses = [i for i, r in enumerate(results) if r is None]
+        batch = summarize_batch([pairs[i] for i in misses])
+        if batch:
+            for i, s in zip(misses, batch):
+                results[i] = s
+                store_summary(*pairs[i], s)
+    todo = [i for i, r in enumerate(results) if r is None]
+    if todo:
+        # Batch unavailable: fall back to per-item calls, overlapped
+        with ThreadPoolExecutor(max_workers=min(8, len(todo))) as ex:
+            for i, s in zip(todo, ex.map(lambda i: summarize(*pairs[i]), todo)):
+                results[i] = s
+    return results
+
 # -----------------------------
 # Craft Action rules (extensible)
 # -----------------------------
+# Earlier rules win when several keywords match
+CRAFT_RULES = {
+    # Engines & Tools
+    "unity": "Test Unity AI sprite/texture generation in one live update.",
+    "unreal": "Leverage Unreal AI/MetaHuman for fast cutscene prototyping.",
+    "metahuman": "Use MetaHuman Animator for real-time facial animation.",
+    "roblox": "Study Roblox’s UGC AI features for inspiration.",
+    "ugc": "Prototype UGC tools to boost retention.",
+    "dlss": "Experiment with DLSS/neural rendering on mid-range devices.",
+    "nvidia": "Evaluate NVIDIA ACE for NPC dialogues in Craft games.",
+    "epic": "Track Epic’s AI updates for dev pipeline changes.",
+
+    # Mobile / Stores
+    "mobile": "Apply AI to cut asset pipeline time on mobile projects.",
+    "android": "Check Google Play’s AI policy compliance.",
+    "ios": "Review Apple rules for AI-generated content.",
+    "app store": "Ensure App Store compliance on AI content.",
+    "google play": "Stay alert for Play Store AI rules.",
+    "hypercasual": "Prototype AI-generated levels for hypercasual loops.",
+    "iap": "Model AI-personalized IAP offers and test uplift.",
+    "ads": "Test AI-optimized ad creatives to boost ROAS.",
+    "ad monetization": "AI-test ad placement for higher yields.",
+
+    # Competitors
+    "supercell": "Benchmark Supercell’s AI use for art/ops efficiency.",
+    "zynga": "Study Zynga’s AI personalization in social loops.",
+    "scopely": "Analyze Scopely’s AI live-ops for monetization tactics.",
+    "netmarble": "Check Netmarble’s AI NPC/quest systems for MMO ideas.",
+
+    # Content Creation
+    "art": "Apply AI art tools for concept sketches.",
+    "asset": "Adopt AI-assisted asset generation.",
+    "animation": "AI-smooth animations for cutscenes.",
+    "sound": "AI-augment sound effects cheaply.",
+    "music": "Try adaptive AI-generated music.",
+    "voice": "Prototype AI voice for NPCs/events.",
+
+    # NPCs & Gameplay
+    "npc": "Test NPCs with AI-driven memory/behavior.",
+    "copilot": "Prototype in-game copilot for tips.",
+    "agent": "Use AI agents for tutorials.",
+    "chatbot": "Deploy AI chatbot for in-game Q&A.",
+
+    # Localization / Markets
+    "translation": "Add AI chat translation for global play.",
+    "localization": "Localize content with AI at scale.",
+    "brazil": "Consider AI-driven localization for Brazil.",
+    "india": "Explore India mobile market with AI features.",
+    "latam": "Check LATAM AI tools for expansion.",
+
+    # Monetization & LiveOps
+    "live ops": "Predict churn with AI and trigger offers.",
+    "churn": "Build churn prediction models.",
+    "personalization": "AI-personalize daily offers.",
+    "retention": "AI-generate personal missions.",
+    "engagement": "Automate quests with AI scoring.",
+    "gacha": "Simulate gacha odds with AI ethically.",
+
+    # Infra & Ops
+    "server": "AI-auto scale live-ops servers.",
+    "infra": "Monitor infra with AI anomaly detection.",
+    "cloud": "Use AI to cut AWS/GCP bills.",
+    "latency": "AI-optimize network latency.",
+    "gpu": "Track GPU market shifts for costs.",
+
+    # Funding / Industry
+    "funding": "Expect API cost shifts after raises.",
+    "valuation": "Big valuations mean more model competition.",
+    "anthropic": "Consider Claude for NPC dialogue.",
+    "openai": "Check OpenAI tools for creative use.",
+    "xai": "Watch xAI for GPU partnerships.",
+    "gemini": "Gemini may bring mobile integrations.",
+
+    # Regulations / Safety
+    "policy": "Stay aligned with AI content policies.",
+    "ethics": "Draft Craft’s AI ethics stance early.",
+    "safety": "Study Roblox Sentinel for moderation.",
+    "moderation": "Test AI chat moderation in Craft games.",
+
+    # Extra categories
+    "vr": "Explore AI-driven VR content pipelines.",
+    "ar": "Test AR experiences with AI NPCs.",
+    "esports": "AI-coach tools could integrate into esports titles.",
+    "marketing": "Use AI for UA campaign optimization.",
+    "influencer": "AI-match influencers to campaigns.",
+    "prototype": "Use AI to auto-generate quick prototypes.",
+    "qa": "AI-bot QA testing for bug hunting.",
+    "trailer": "AI-generate quick trailers for new features.",
+    "story": "Use AI to ideate branching storylines.",
+    "dialogue": "AI-polish dialogue variations for NPCs."
+}
+
+CRAFT_FALLBACK = "Identify a 1-week AI experiment in art, design, or ops to validate impact quickly."
+
 def craft_action(title: str, summary: str) -> str:
     text = (title + " " + summary).lower()
-
-    rules = {
-        # Engines & Tools
-        "unity": "Test Unity AI sprite/texture generation in one live update.",
-        "unreal": "Leverage Unreal AI/MetaHuman for fast cutscene prototyping.",
-        "metahuman": "Use MetaHuman Animator for real-time facial animation.",
-        "roblox": "Study Roblox’s UGC AI features for inspiration.",
-        "ugc": "Prototype UGC tools to boost retention.",
-        "dlss": "Experiment with DLSS/neural rendering on mid-range devices.",
-        "nvidia": "Evaluate NVIDIA ACE for NPC dialogues in Craft games.",
-        "epic": "Track Epic’s AI updates for dev pipeline changes.",
-
-        # Mobile / Stores
-        "mobile": "Apply AI to cut asset pipeline time on mobile projects.",
-        "android": "Check Google Play’s AI policy compliance.",
-        "ios": "Review Apple rules for AI-generated content.",
-        "app store": "Ensure App Store compliance on AI content.",
-        "google play": "Stay alert for Play Store AI rules.",
-        "hypercasual": "Prototype AI-generated levels for hypercasual loops.",
-        "iap": "Model AI-personalized IAP offers and test uplift.",
-        "ads": "Test AI-optimized ad creatives to boost ROAS.",
-        "ad monetization": "AI-test ad placement for higher yields.",
-
-        # Competitors
-        "supercell": "Benchmark Supercell’s AI use for art/ops efficiency.",
-        "zynga": "Study Zynga’s AI personalization in social loops.",
-        "scopely": "Analyze Scopely’s AI live-ops for monetization tactics.",
-        "netmarble": "Check Netmarble’s AI NPC/quest systems for MMO ideas.",
-
-        # Content Creation
-        "art": "Apply AI art tools for concept sketches.",
-        "asset": "Adopt AI-assisted asset generation.",
-        "animation": "AI-smooth animations for cutscenes.",
-        "sound": "AI-augment sound effects cheaply.",
-        "music": "Try adaptive AI-generated music.",
-        "voice": "Prototype AI voice for NPCs/events.",
-
-        # NPCs & Gameplay
-        "npc": "Test NPCs with AI-driven memory/behavior.",
-        "copilot": "Prototype in-game copilot for tips.",
-        "agent": "Use AI agents for tutorials.",
-        "chatbot": "Deploy AI chatbot for in-game Q&A.",
-
-        # Localization / Markets
-        "translation": "Add AI chat translation for global play.",
-        "localization": "Localize content with AI at scale.",
-        "brazil": "Consider AI-driven localization for Brazil.",
-        "india": "Explore India mobile market with AI features.",
-        "latam": "Check LATAM AI tools for expansion.",
-
-        # Monetization & LiveOps
-        "live ops": "Predict churn with AI and trigger offers.",
-        "churn": "Build churn prediction models.",
-        "personalization": "AI-personalize daily offers.",
-        "retention": "AI-generate personal missions.",
-        "engagement": "Automate quests with AI scoring.",
-        "gacha": "Simulate gacha odds with AI ethically.",
-
-        # Infra & Ops
-        "server": "AI-auto scale live-ops servers.",
-        "infra": "Monitor infra with AI anomaly detection.",
-        "cloud": "Use AI to cut AWS/GCP bills.",
-        "latency": "AI-optimize network latency.",
-        "gpu": "Track GPU market shifts for costs.",
-
-        # Funding / Industry
-        "funding": "Expect API cost shifts after raises.",
-        "valuation": "Big valuations mean more model competition.",
-        "anthropic": "Consider Claude for NPC dialogue.",
-        "openai": "Check OpenAI tools for creative use.",
-        "xai": "Watch xAI for GPU partnerships.",
-        "gemini": "Gemini may bring mobile integrations.",
-
-        # Regulations / Safety
-        "policy": "Stay aligned with AI content policies.",
-        "ethics": "Draft Craft’s AI ethics stance early.",
-        "safety": "Study Roblox Sentinel for moderation.",
-        "moderation": "Test AI chat moderation in Craft games.",
-
-        # Extra categories
-        "vr": "Explore AI-driven VR content pipelines.",
-        "ar": "Test AR experiences with AI NPCs.",
-        "esports": "AI-coach tools could integrate into esports titles.",
-        "marketing": "Use AI for UA campaign optimization.",
-        "influencer": "AI-match influencers to campaigns.",
-        "prototype": "Use AI to auto-generate quick prototypes.",
-        "qa": "AI-bot QA testing for bug hunting.",
-        "trailer": "AI-generate quick trailers for new features.",
-        "story": "Use AI to ideate branching storylines.",
-        "dialogue": "AI-polish dialogue variations for NPCs."
-    }
-
-    for keyword, action in rules.items():
+    for keyword, action in CRAFT_RULES.items():
         if keyword in text:
             return action
-
-    return "Identify a 1-week AI experiment in art, design, or ops to validate impact quickly."
+    return CRAFT_FALLBACK
 
 # -----------------------------
 # Selection & Formatting
 # -----------------------------
-def pick_top(items: List[dict], want: int) -> List[dict]:
+def pick_top(items: List[dict], want: int, now: Optional[datetime] = None) -> List[dict]:
+    if now is None:
+        now = datetime.now(tz=IST)
     best: Dict[str, Tuple[float, dict]] = {}
     for e in items:
         title = normalize_text(e.get("title",""))
         link = canonical_url(e.get("link",""))
         if not title or not link: continue
-        h = hash_item(title, link)
-        s = score_item(e)
-        if h not in best or s > best[h][0]:
+        h = item_key(e)
+        s = score_item(e, now)
+        cur = best.get(h)
+        if cur is None or s > cur[0]:
             best[h] = (s,e)
-    ranked = sorted([v[1] for v in best.values()], key=score_item, reverse=True)
-    return ranked[:want]
+    # Sort on the scores computed above instead of rescoring
+    ranked = sorted(best.values(), key=lambda v: v[0], reverse=True)
+    return [e for _, e in ranked[:want]]
 
-def format_item(e: dict) -> str:
+def item_texts(e: dict) -> Tuple[str, str]:
     title = normalize_text(e.get("title",""))
-    link = canonical_url(e.get("link",""))
     rawsum = normalize_text(html.unescape(e.get("summary",""))) or title
-    one_liner = summarize(title, rawsum)  # <= 12 words
-    short = shorten_url(link)
+    return title, rawsum
+
+def format_item(e: dict, one_liner: str, short: str) -> str:
+    title, rawsum = item_texts(e)
     action = craft_action(title, rawsum)
     # Bullet + short link + bold Craft Action
     return f"• {one_liner}\n👉 {short}\n**Craft Action:** {action}"
 
 def pad_to_three(items: List[dict], pool: List[dict]) -> List[dict]:
-    seen = {hash_item(normalize_text(i.get("title","")), canonical_url(i.get("link",""))) for i in items}
+    seen = {item_key(i) for i in items}
     for e in pool:
         if len(items) >= 3: break
-        h = hash_item(normalize_text(e.get("title","")), canonical_url(e.get("link","")))
+        h = item_key(e)
         if h not in seen:
             items.append(e); seen.add(h)
     return items
 
 def build_message(gaming_items: List[dict], general_items: List[dict]) -> str:
+    items = gaming_items + general_items
+    # Summaries and short links are independent network work: run both at once
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        sum_job = ex.submit(summarize_many, [item_texts(e) for e in items])  # <= 12 words each
+        short_job = ex.submit(shorten_url_many, [canonical_url(e.get("link","")) for e in items])
+        summaries, shorts = sum_job.result(), short_job.result()
+    gaming_sums, general_sums = summaries[:len(gaming_items)], summaries[len(gaming_items):]
+
     lines = []
     lines.append("")  # leading blank line so username has a spacer above header
 
     # Gaming header
     lines.append("**🔵 AI IN GAMING**")
-    for e in gaming_items:
+    for e, one_liner in zip(gaming_items, gaming_sums):
         lines.append("")
-        lines.append(format_item(e))
+        lines.append(format_item(e, one_liner, shorts[canonical_url(e.get("link",""))]))
 
     # Two blank lines between sections
     lines.append("")
@@ -279,9 +600,9 @@ def build_message(gaming_items: List[dict], general_items: List[dict]) -> str:
 
     # General header
     lines.append("**🔷 AI IN GENERAL**")
-    for e in general_items:
+    for e, one_liner in zip(general_items, general_sums):
         lines.append("")
-        lines.append(format_item(e))
+        lines.append(format_item(e, one_liner, shorts[canonical_url(e.get("link",""))]))
 
     return "\n".join(lines)
 
@@ -297,7 +618,7 @@ def send_telegram_message(text: str):
         "parse_mode": "Markdown",
         "disable_web_page_preview": True
     }
-    r = requests.post(url, json=payload, timeout=20)
+    r = SESSION.post(url, json=payload, timeout=20)
     r.raise_for_status()
     return r.json()
 
@@ -305,27 +626,28 @@ def send_telegram_message(text: str):
 # Main
 # -----------------------------
 def build_and_send():
+    now = datetime.now(tz=IST)  # one clock read for the whole run
     sources = load_sources()
-    general_all = fetch_feeds(sources.get("general_ai", []))
-    mobile_all  = fetch_feeds(sources.get("mobile_gaming", []))
+    general_all, mobile_all = fetch_feed_groups(sources.get("general_ai", []), sources.get("mobile_gaming", []))
 
     # siphon mobile-relevant from general into gaming pool
     siphoned = []
     for e in general_all:
-        text = (e.get("title","") + " " + e.get("summary","")).lower()
-        if any(k in text for k in ["mobile","android","ios","app store","google play","unity","roblox","snapdragon"]):
+        if is_mobile_relevant(e.get("title","") + " " + e.get("summary","")):
             siphoned.append(e)
 
     gaming_pool = mobile_all + siphoned
-    general_pool = [e for e in general_all if e not in siphoned]
+    siphoned_keys = {item_key(e) for e in siphoned}
+    general_pool = [e for e in general_all if item_key(e) not in siphoned_keys]
 
-    top_gaming = pick_top(gaming_pool, 3)
-    top_general = pick_top(general_pool, 3)
+    top_gaming = pick_top(gaming_pool, 3, now)
+    top_general = pick_top(general_pool, 3, now)
 
     if len(top_gaming) < 3:
         top_gaming = pad_to_three(top_gaming, general_pool)
     if len(top_general) < 3:
-        remaining = [e for e in general_pool if e not in top_general and e not in top_gaming]
+        taken = {item_key(e) for e in top_general + top_gaming}
+        remaining = [e for e in general_pool if item_key(e) not in taken]
         top_general = pad_to_three(top_general, remaining)
 
     msg = build_message(top_gaming, top_general)